@@ -2,13 +2,14 @@ from __future__ import annotations
 
 import argparse
 import json
+import traceback
 from pathlib import Path
 
 import pandas as pd
 
-from src.research.backtest import backtest_long_cash_from_prob
+from src.research.backtest import BacktestResult, backtest_long_cash_from_prob
 from src.research.batch import run_batch_research, run_portfolio_backtest
-from src.research.data import download_yahoo_ohlcv
+from src.research.data import download_yahoo_ohlcv, ticker_to_filename
 from src.research.features import add_label_forward_return_up, clean_ml_frame, make_features
 from src.research.ml import save_model, train_baseline_classifier, walk_forward_predict_proba
 from src.research.universe import load_universe_file
@@ -36,7 +37,7 @@ def cmd_research(args: argparse.Namespace) -> int:
     outdir = Path(args.outdir)
     outdir.mkdir(parents=True, exist_ok=True)
 
-    cache = Path(args.cache) if args.cache else (outdir / f"{args.ticker.replace(':', '_').replace('/', '_')}.csv")
+    cache = Path(args.cache) if args.cache else (outdir / f"{ticker_to_filename(args.ticker)}.csv")
     ohlcv = download_yahoo_ohlcv(
         ticker=args.ticker,
         start=args.start,
@@ -63,6 +64,7 @@ def cmd_research(args: argparse.Namespace) -> int:
             min_train_size=min_train,
             retrain_every=args.retrain_every,
             random_state=args.random_state,
+            warm_start=args.warm_start,
         )
         pred = pd.DataFrame(index=ml_df.index, data={"prob_up": prob, "y_true": ml_df["label_up"].values})
         trained = None
@@ -141,6 +143,8 @@ def cmd_batch(args: argparse.Namespace) -> int:
             position_sizing=args.position_sizing,
             min_train_size=getattr(args, "min_train_size", 252),
             retrain_every=getattr(args, "retrain_every", 20),
+            warm_start=getattr(args, "warm_start", False),
+            max_workers=args.workers,
         )
         
         print("Portfolio backtest complete")
@@ -165,6 +169,7 @@ def cmd_batch(args: argparse.Namespace) -> int:
             prob_threshold=args.prob_threshold,
             fee_bps=args.fee_bps,
             compare_index=getattr(args, "compare_index", None),
+            max_workers=args.workers,
         )
 
         print("Batch run complete")
@@ -181,7 +186,7 @@ def cmd_paper(args: argparse.Namespace) -> int:
     outdir = Path(args.outdir)
     outdir.mkdir(parents=True, exist_ok=True)
 
-    cache = Path(args.cache) if args.cache else (outdir / f"{args.ticker.replace(':', '_').replace('/', '_')}.csv")
+    cache = Path(args.cache) if args.cache else (outdir / f"{ticker_to_filename(args.ticker)}.csv")
     ohlcv = download_yahoo_ohlcv(
         ticker=args.ticker,
         start=args.start,
@@ -202,6 +207,7 @@ def cmd_paper(args: argparse.Namespace) -> int:
         min_train_size=max(50, int(len(ml_df) * 0.6)) if len(ml_df) <= args.min_train_size else args.min_train_size,
         retrain_every=args.retrain_every,
         random_state=args.random_state,
+        warm_start=args.warm_start,
     )
 
     equity_df, trades_df = paper_trade_long_cash(
@@ -257,7 +263,6 @@ def cmd_visualize(args: argparse.Namespace) -> int:
             stats = json.loads(stats_path.read_text())
         
         # Create BacktestResult-like object
-        from src.research.backtest import BacktestResult
         daily_returns = equity_curve.pct_change(1)
         
         result = BacktestResult(
@@ -281,7 +286,6 @@ def cmd_visualize(args: argparse.Namespace) -> int:
         
     except Exception as e:
         print(f"Error generating visualization report: {e}")
-        import traceback
         traceback.print_exc()
         return 1
 
@@ -301,7 +305,7 @@ def build_parser() -> argparse.ArgumentParser:
     r.add_argument("--start", required=True, help="Start date YYYY-MM-DD")
     r.add_argument("--end", required=True, help="End date YYYY-MM-DD")
     r.add_argument("--interval", default="1d", help="Data interval (default: 1d)")
-    r.add_argument("--cache", default=None, help="Optional CSV cache path")
+    r.add_argument("--cache", default=None, help="Optional cache path (.csv, or .parquet with pyarrow)")
     r.add_argument("--refresh", action="store_true", help="Re-download data even if cache exists")
 
     r.add_argument("--outdir", default="outputs/research", help="Output directory")
@@ -314,6 +318,7 @@ def build_parser() -> argparse.ArgumentParser:
     r.add_argument("--train-mode", choices=["split", "walkforward"], default="walkforward", help="Training mode")
     r.add_argument("--min-train-size", type=int, default=252, help="Min rows before walk-forward starts")
     r.add_argument("--retrain-every", type=int, default=20, help="Retrain frequency (rows) for walk-forward")
+    r.add_argument("--warm-start", action="store_true", help="Warm-start each walk-forward refit from the previous model")
     r.set_defaults(func=cmd_research)
 
     b = sub.add_parser("batch", help="Run research/backtest across a universe of tickers and aggregate results.")
@@ -333,7 +338,9 @@ def build_parser() -> argparse.ArgumentParser:
     b.add_argument("--fee-bps", type=float, default=10.0, help="Transaction fee per position change (bps)")
     b.add_argument("--min-train-size", type=int, default=252, help="Min rows before walk-forward starts (portfolio mode)")
     b.add_argument("--retrain-every", type=int, default=20, help="Retrain frequency (rows) for walk-forward (portfolio mode)")
+    b.add_argument("--warm-start", action="store_true", help="Warm-start each walk-forward refit from the previous model (portfolio mode)")
     b.add_argument("--compare-index", default=None, help="Compare strategy returns vs index benchmark (e.g., ^NSEI, NIFTYBEES.NS)")
+    b.add_argument("--workers", type=int, default=4, help="Tickers processed concurrently (1 = sequential)")
     b.set_defaults(func=cmd_batch)
 
     ppr = sub.add_parser("paper", help="Run a paper-trading simulation (no broker).")
@@ -341,7 +348,7 @@ def build_parser() -> argparse.ArgumentParser:
     ppr.add_argument("--start", required=True, help="Start date YYYY-MM-DD")
     ppr.add_argument("--end", required=True, help="End date YYYY-MM-DD")
     ppr.add_argument("--interval", default="1d", help="Data interval (default: 1d)")
-    ppr.add_argument("--cache", default=None, help="Optional CSV cache path")
+    ppr.add_argument("--cache", default=None, help="Optional cache path (.csv, or .parquet with pyarrow)")
     ppr.add_argument("--refresh", action="store_true", help="Re-download data even if cache exists")
     ppr.add_argument("--outdir", default="outputs/paper", help="Output directory")
 
@@ -355,6 +362,7 @@ def build_parser() -> argparse.ArgumentParser:
     ppr.add_argument("--train-mode", choices=["walkforward"], default="walkforward", help="Training mode")
     ppr.add_argument("--min-train-size", type=int, default=252, help="Min rows before walk-forward starts")
     ppr.add_argument("--retrain-every", type=int, default=20, help="Retrain frequency (rows) for walk-forward")
+    ppr.add_argument("--warm-start", action="store_true", help="Warm-start each walk-forward refit from the previous model")
     ppr.set_defaults(func=cmd_paper)
 
     viz = sub.add_parser("visualize", help="Generate visualization report from existing backtest results.")
@@ -31,7 +31,7 @@ def paper_trade_long_cash(
     - Execute at close of day t (simplified)
     - Position is either 0 or 1 share (qty=1) for demo purposes
     """
-    close = ohlcv["close"].astype(float).copy()
+    close = ohlcv["close"].astype(float)
     p = prob_up.reindex(close.index)
     first_valid = p.first_valid_index()
     if first_valid is None:
@@ -45,10 +45,12 @@ def paper_trade_long_cash(
     pos = 0
     trades: list[Trade] = []
 
+    fee = (fee_bps / 10000.0) * 1.0  # bps on notional ~ price; simplified below
+
     equity_series = []
-    for dt, price in close.items():
-        want = int(desired.loc[dt])
-        fee = (fee_bps / 10000.0) * 1.0  # bps on notional ~ price; simplified below
+    # Walk plain arrays: no per-bar label lookup into `desired`
+    for dt, price, want in zip(close.index, close.to_numpy(), desired.to_numpy()):
+        want = int(want)
 
         if want != pos:
             if want == 1 and pos == 0:
@@ -0,0 +1,127 @@
+"""
+Numba kernel for the feature set built by `make_features`.
+
+Optional fast path: `src.research.features` only uses this module when numba is
+installed. Each helper mirrors the pandas operation it replaces (pct_change,
+rolling mean/std, ewm(adjust=False), RSI) so both paths produce the same columns.
+Kernels release the GIL (nogil=True) so batch workers can build features in parallel.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True, nogil=True, error_model="numpy")
+def _pct_change(x, periods, out):
+    for i in range(x.shape[0]):
+        if i < periods:
+            out[i] = np.nan
+        else:
+            out[i] = x[i] / x[i - periods] - 1.0
+
+
+@njit(cache=True, nogil=True)
+def _rolling_mean(x, window, out):
+    for i in range(x.shape[0]):
+        if i < window - 1:
+            out[i] = np.nan
+            continue
+        s = 0.0
+        for j in range(i - window + 1, i + 1):
+            s += x[j]
+        out[i] = s / window
+
+
+@njit(cache=True, nogil=True)
+def _rolling_std(x, window, out):
+    # Sample std (ddof=1), two-pass per window
+    for i in range(x.shape[0]):
+        if i < window - 1:
+            out[i] = np.nan
+            continue
+        s = 0.0
+        for j in range(i - window + 1, i + 1):
+            s += x[j]
+        mean = s / window
+        ss = 0.0
+        for j in range(i - window + 1, i + 1):
+            ss += (x[j] - mean) ** 2
+        out[i] = np.sqrt(ss / (window - 1))
+
+
+@njit(cache=True, nogil=True)
+def _ewm_mean(x, span, out):
+    # Same recurrence as pandas' ewm(span=span, adjust=False).mean()
+    n = x.shape[0]
+    if n == 0:
+        return
+    com = (span - 1) / 2.0
+    alpha = 1.0 / (1.0 + com)
+    old_wt = 1.0 - alpha
+    weighted = x[0]
+    out[0] = weighted
+    for i in range(1, n):
+        cur = x[i]
+        if weighted != cur:
+            weighted = (old_wt * weighted + alpha * cur) / (old_wt + alpha)
+        out[i] = weighted
+
+
+@njit(cache=True, nogil=True, error_model="numpy")
+def _rsi(close, window, out):
+    n = close.shape[0]
+    gain = np.zeros(n)
+    loss = np.zeros(n)
+    for i in range(1, n):
+        delta = close[i] - close[i - 1]
+        if delta > 0:
+            gain[i] = delta
+        elif delta < 0:
+            loss[i] = -delta
+    avg_gain = np.empty(n)
+    avg_loss = np.empty(n)
+    _rolling_mean(gain, window, avg_gain)
+    _rolling_mean(loss, window, avg_loss)
+    for i in range(n):
+        if avg_loss[i] == 0.0:
+            out[i] = np.nan
+        else:
+            out[i] = 100.0 - (100.0 / (1.0 + avg_gain[i] / avg_loss[i]))
+
+
+@njit(cache=True, nogil=True)
+def build_features(close, volume):
+    """
+    Input: float64 close/volume arrays of equal length (no NaN/inf, close > 0).
+    Output: (n, 12) array in the column order of `features.FEATURE_COLS`.
+    """
+    n = close.shape[0]
+    out = np.empty((n, 12))
+
+    _pct_change(close, 1, out[:, 0])
+    _pct_change(close, 5, out[:, 1])
+    _rolling_std(out[:, 0], 10, out[:, 2])
+
+    _rolling_mean(close, 10, out[:, 3])
+    _rolling_mean(close, 50, out[:, 4])
+    _ewm_mean(close, 20, out[:, 5])
+
+    _rsi(close, 14, out[:, 6])
+
+    ema_short = np.empty(n)
+    ema_long = np.empty(n)
+    _ewm_mean(close, 12, ema_short)
+    _ewm_mean(close, 26, ema_long)
+    for i in range(n):
+        out[i, 7] = ema_short[i] - ema_long[i]
+    _ewm_mean(out[:, 7], 9, out[:, 8])
+    for i in range(n):
+        out[i, 9] = out[i, 7] - out[i, 8]
+
+    # volume features
+    _pct_change(volume, 1, out[:, 10])
+    _rolling_mean(volume, 20, out[:, 11])
+
+    return out
@@ -51,7 +51,7 @@ def backtest_long_cash_from_prob(
     - Use close-to-close returns
     - Apply fee (in basis points) on position changes (round-trip modeled as 1 fee per change)
     """
-    close = df["close"].copy()
+    close = df["close"]
     ret = close.pct_change(1)
 
     # Restrict to the period where we actually have model outputs
@@ -1,13 +1,14 @@
 from __future__ import annotations
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
 import pandas as pd
 
 from src.research.backtest import backtest_long_cash_from_prob
-from src.research.data import download_yahoo_ohlcv
+from src.research.data import download_yahoo_ohlcv, download_yahoo_ohlcv_multi, ticker_to_filename
 from src.research.features import add_label_forward_return_up, clean_ml_frame, make_features
 from src.research.index_analysis import analyze_index_correlation
 from src.research.ml import train_baseline_classifier, walk_forward_predict_proba
@@ -50,26 +51,68 @@ def run_batch_research(
     prob_threshold: float = 0.55,
     fee_bps: float = 10.0,
     compare_index: str | None = None,
+    max_workers: int = 1,
 ) -> BatchRunResult:
+    """
+    Research + backtest each ticker independently and write summary.csv.
+
+    Tickers are processed concurrently when max_workers > 1 (downloads are I/O-bound);
+    summary rows keep the order of `tickers`.
+    """
     outdir = Path(outdir)
     outdir.mkdir(parents=True, exist_ok=True)
 
-    rows: list[dict] = []
+    cache_paths = {t: outdir / ticker_to_filename(t) / f"{t}.csv" for t in tickers}
+    index_cache = None
+    if compare_index:
+        index_cache = outdir / f"{compare_index.replace('^', '').replace('.NS', '').replace('.BO', '')}_index.csv"
+        cache_paths.setdefault(compare_index, index_cache)
+
+    # One Yahoo request for everything missing from cache; per-ticker downloads below
+    # only run for symbols the batch could not deliver (and report their own errors)
+    prefetched = download_yahoo_ohlcv_multi(
+        list(cache_paths),
+        start=start,
+        end=end,
+        interval=interval,
+        cache_paths=cache_paths,
+        refresh=refresh,
+    )
+
+    # Benchmark returns are shared by every ticker: load them once, before fanning out
+    index_returns = None
+    if compare_index:
+        try:
+            index_ohlcv = prefetched.get(compare_index)
+            if index_ohlcv is None:
+                index_ohlcv = download_yahoo_ohlcv(
+                    ticker=compare_index,
+                    start=start,
+                    end=end,
+                    interval=interval,
+                    cache_path=index_cache,
+                    refresh=refresh,
+                )
+            index_returns = index_ohlcv.df["close"].pct_change(1).dropna()
+        except Exception:  # noqa: BLE001
+            pass  # Skip index comparison if it fails
 
-    for t in tickers:
-        t_dir = outdir / t.replace(":", "_").replace("/", "_")
+    def _research_one(t: str) -> dict:
+        t_dir = outdir / ticker_to_filename(t)
         t_dir.mkdir(parents=True, exist_ok=True)
 
-        cache = t_dir / f"{t}.csv"
+        cache = cache_paths[t]
         try:
-            ohlcv = download_yahoo_ohlcv(
-                ticker=t,
-                start=start,
-                end=end,
-                interval=interval,
-                cache_path=cache,
-                refresh=refresh,
-            )
+            ohlcv = prefetched.get(t)
+            if ohlcv is None:
+                ohlcv = download_yahoo_ohlcv(
+                    ticker=t,
+                    start=start,
+                    end=end,
+                    interval=interval,
+                    cache_path=cache,
+                    refresh=refresh,
+                )
             feat = make_features(ohlcv.df)
             labeled = add_label_forward_return_up(feat, days=label_days, threshold=label_threshold)
             ml_df = clean_ml_frame(labeled, feature_cols=DEFAULT_FEATURE_COLS, label_col="label_up")
@@ -94,28 +137,24 @@ def run_batch_research(
             row = {"ticker": t, **bt.stats}
             
             # Add index-relative metrics if compare_index is provided
-            if compare_index:
+            if index_returns is not None:
                 try:
-                    index_ohlcv = download_yahoo_ohlcv(
-                        ticker=compare_index,
-                        start=start,
-                        end=end,
-                        interval=interval,
-                        cache_path=outdir / f"{compare_index.replace('^', '').replace('.NS', '').replace('.BO', '')}_index.csv",
-                        refresh=refresh,
-                    )
-                    index_returns = index_ohlcv.df["close"].pct_change(1).dropna()
                     stock_returns = ohlcv.df["close"].pct_change(1).dropna()
                     
-                    from src.research.index_analysis import analyze_index_correlation
                     corr_metrics = analyze_index_correlation(index_returns, stock_returns)
                     row.update({f"index_{k}": v for k, v in corr_metrics.items()})
                 except Exception:  # noqa: BLE001
                     pass  # Skip index comparison if it fails
             
-            rows.append(row)
+            return row
         except Exception as e:  # noqa: BLE001
-            rows.append({"ticker": t, "error": str(e)})
+            return {"ticker": t, "error": str(e)}
+
+    if max_workers > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as ex:
+            rows = list(ex.map(_research_one, tickers))
+    else:
+        rows = [_research_one(t) for t in tickers]
 
     summary = pd.DataFrame(rows)
     summary_path = outdir / "summary.csv"
@@ -139,6 +178,8 @@ def run_portfolio_backtest(
     position_sizing: str = "equal_weight",
     min_train_size: int = 252,
     retrain_every: int = 20,
+    warm_start: bool = False,
+    max_workers: int = 1,
 ) -> PortfolioBacktestResult:
     """
     Run portfolio-level backtest (multiple assets simultaneously).
@@ -158,6 +199,8 @@ def run_portfolio_backtest(
         position_sizing: Position sizing method ("equal_weight" or "custom")
         min_train_size: Minimum training size for walk-forward
         retrain_every: Retrain frequency for walk-forward
+        warm_start: Seed each walk-forward refit with the previous model's coefficients
+        max_workers: Tickers prepared (download + features + walk-forward) concurrently
         
     Returns:
         PortfolioBacktestResult with aggregated portfolio metrics
@@ -168,21 +211,34 @@ def run_portfolio_backtest(
     # Download data and prepare features for all tickers
     ticker_data = {}
     ticker_probabilities = {}
+
+    cache_paths = {t: outdir / ticker_to_filename(t) / f"{t}.csv" for t in tickers}
+    # One Yahoo request for every ticker missing from cache; any ticker it could not
+    # deliver goes through download_yahoo_ohlcv below for retries and a proper error
+    prefetched = download_yahoo_ohlcv_multi(
+        tickers,
+        start=start,
+        end=end,
+        interval=interval,
+        cache_paths=cache_paths,
+        refresh=refresh,
+    )
     
-    for t in tickers:
-        t_dir = outdir / t.replace(":", "_").replace("/", "_")
-        t_dir.mkdir(parents=True, exist_ok=True)
-        cache = t_dir / f"{t}.csv"
+    def _prepare_one(t: str) -> tuple[pd.DataFrame, pd.Series]:
+        # Nothing else is written per ticker in portfolio mode; the cache writer creates its own directory
+        cache = cache_paths[t]
         
         try:
-            ohlcv = download_yahoo_ohlcv(
-                ticker=t,
-                start=start,
-                end=end,
-                interval=interval,
-                cache_path=cache,
-                refresh=refresh,
-            )
+            ohlcv = prefetched.get(t)
+            if ohlcv is None:
+                ohlcv = download_yahoo_ohlcv(
+                    ticker=t,
+                    start=start,
+                    end=end,
+                    interval=interval,
+                    cache_path=cache,
+                    refresh=refresh,
+                )
             feat = make_features(ohlcv.df)
             labeled = add_label_forward_return_up(feat, days=label_days, threshold=label_threshold)
             ml_df = clean_ml_frame(labeled, feature_cols=DEFAULT_FEATURE_COLS, label_col="label_up")
@@ -195,13 +251,23 @@ def run_portfolio_backtest(
                 min_train_size=min_train_size,
                 retrain_every=retrain_every,
                 random_state=random_state,
+                warm_start=warm_start,
             )
-            
-            ticker_data[t] = ml_df
-            ticker_probabilities[t] = prob
+            return ml_df, prob
             
         except Exception as e:  # noqa: BLE001
             raise RuntimeError(f"Failed to prepare data for {t}: {e}") from e
+
+    # Tickers are independent; map() keeps ticker order and re-raises the first failure in that order
+    if max_workers > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as ex:
+            prepared = list(ex.map(_prepare_one, tickers))
+    else:
+        prepared = [_prepare_one(t) for t in tickers]
+
+    for t, (ml_df, prob) in zip(tickers, prepared):
+        ticker_data[t] = ml_df
+        ticker_probabilities[t] = prob
     
     # Determine position sizing
     sizing_enum = PositionSizing.EQUAL_WEIGHT
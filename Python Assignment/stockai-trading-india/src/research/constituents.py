@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -48,6 +49,21 @@ MANUAL_SENSEX = [
 ]
 
 
+# Index name (upper-case) -> manual constituent list
+_MANUAL_CONSTITUENTS = {
+    "NIFTY50": MANUAL_NIFTY50,
+    "BANKNIFTY": MANUAL_BANKNIFTY,
+    "BANKNIFTY50": MANUAL_BANKNIFTY,
+    "SENSEX": MANUAL_SENSEX,
+}
+
+
+@lru_cache(maxsize=32)
+def _read_cache_file(path: str, mtime_ns: int) -> dict:
+    """Parsed constituents cache file; keyed on mtime so a rewritten file is read again."""
+    return json.loads(Path(path).read_text())
+
+
 def get_constituents(index_name: str, cache_dir: Optional[Path] = None) -> ConstituentList:
     """
     Get constituent list for a given index.
@@ -67,12 +83,16 @@ def get_constituents(index_name: str, cache_dir: Optional[Path] = None) -> Const
     # Check cache first
     if cache_dir:
         cache_file = cache_dir / f"constituents_{index_name_upper.lower()}.json"
-        if cache_file.exists():
+        try:
+            mtime_ns = cache_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            mtime_ns = None
+        if mtime_ns is not None:
             try:
-                data = json.loads(cache_file.read_text())
+                data = _read_cache_file(str(cache_file), mtime_ns)
                 return ConstituentList(
                     index_name=data["index_name"],
-                    tickers=data["tickers"],
+                    tickers=list(data["tickers"]),
                     source=data.get("source", "cache"),
                     last_updated=data.get("last_updated")
                 )
@@ -80,12 +100,9 @@ def get_constituents(index_name: str, cache_dir: Optional[Path] = None) -> Const
                 pass  # Fall back to manual list
     
     # Use manual lists (could be enhanced with NSE/BSE API calls in future)
-    if index_name_upper == "NIFTY50":
-        tickers = MANUAL_NIFTY50.copy()
-    elif index_name_upper in ("BANKNIFTY", "BANKNIFTY50"):
-        tickers = MANUAL_BANKNIFTY.copy()
-    elif index_name_upper == "SENSEX":
-        tickers = MANUAL_SENSEX.copy()
+    manual = _MANUAL_CONSTITUENTS.get(index_name_upper)
+    if manual is not None:
+        tickers = manual.copy()
     else:
         raise ValueError(
             f"Unknown index: {index_name}. "
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass
+from datetime import date
 from pathlib import Path
 from typing import Optional
 
 import numpy as np
 import pandas as pd
+import threading
 import time
 import logging
 
@@ -17,6 +20,43 @@ class OHLCV:
     df: pd.DataFrame  # index: DatetimeIndex (tz-naive), columns: open/high/low/close/volume
 
 
+# In-process memo of parsed cache files: (ticker, interval, cache_path) -> (day, mtime_ns, OHLCV).
+# Entries are only reused on the same day and while the cache file is unchanged.
+_OHLCV_MEMO: OrderedDict[tuple[str, str, str], tuple[date, int, OHLCV]] = OrderedDict()
+_OHLCV_MEMO_MAX = 128
+_OHLCV_MEMO_LOCK = threading.Lock()
+
+
+def _memo_get(key: tuple[str, str, str], mtime_ns: int) -> Optional[OHLCV]:
+    with _OHLCV_MEMO_LOCK:
+        entry = _OHLCV_MEMO.get(key)
+        if entry is None:
+            return None
+        day, cached_mtime_ns, ohlcv = entry
+        if day != date.today() or cached_mtime_ns != mtime_ns:
+            del _OHLCV_MEMO[key]
+            return None
+        _OHLCV_MEMO.move_to_end(key)
+        return ohlcv
+
+
+def _memo_put(key: tuple[str, str, str], mtime_ns: int, ohlcv: OHLCV) -> None:
+    with _OHLCV_MEMO_LOCK:
+        _OHLCV_MEMO[key] = (date.today(), mtime_ns, ohlcv)
+        _OHLCV_MEMO.move_to_end(key)
+        while len(_OHLCV_MEMO) > _OHLCV_MEMO_MAX:
+            _OHLCV_MEMO.popitem(last=False)
+
+
+# ':' and '/' are not safe in file/directory names
+_TICKER_NAME_TABLE = str.maketrans({":": "_", "/": "_"})
+
+
+def ticker_to_filename(ticker: str) -> str:
+    """Filesystem-safe name for a ticker (cache files, per-ticker output dirs)."""
+    return ticker.translate(_TICKER_NAME_TABLE)
+
+
 def _is_index_ticker(ticker: str) -> bool:
     """Check if ticker is an index (starts with ^)"""
     return ticker.startswith("^")
@@ -43,7 +83,7 @@ def _validate_ohlcv_data(df: pd.DataFrame, ticker: str) -> None:
     all_nan_rows = df[required].isna().all(axis=1)
     if all_nan_rows.any():
         nan_count = all_nan_rows.sum()
-        logger.warning(f"{ticker}: Found {nan_count} rows with all NaN values. These will be dropped.")
+        logger.warning("%s: Found %d rows with all NaN values. These will be dropped.", ticker, nan_count)
 
     # Check for negative prices (shouldn't happen)
     price_cols = ["open", "high", "low", "close"]
@@ -66,8 +106,10 @@ def _validate_ohlcv_data(df: pd.DataFrame, ticker: str) -> None:
     if invalid_ohlc.any():
         invalid_count = invalid_ohlc.sum()
         logger.warning(
-            f"{ticker}: Found {invalid_count} rows with invalid OHLC relationships "
-            "(e.g., high < low). These may indicate data quality issues."
+            "%s: Found %d rows with invalid OHLC relationships "
+            "(e.g., high < low). These may indicate data quality issues.",
+            ticker,
+            invalid_count,
         )
 
     # Check for large gaps (more than 5 trading days missing)
@@ -78,8 +120,10 @@ def _validate_ohlcv_data(df: pd.DataFrame, ticker: str) -> None:
         if large_gaps.any():
             gap_count = large_gaps.sum()
             logger.warning(
-                f"{ticker}: Found {gap_count} gaps larger than 7 days. "
-                "This may indicate missing data or market holidays."
+                "%s: Found %d gaps larger than 7 days. "
+                "This may indicate missing data or market holidays.",
+                ticker,
+                gap_count,
             )
 
     # Check for zero or very small prices (might indicate stock split issues)
@@ -87,8 +131,10 @@ def _validate_ohlcv_data(df: pd.DataFrame, ticker: str) -> None:
     if very_small_prices.any():
         small_count = very_small_prices.sum()
         logger.warning(
-            f"{ticker}: Found {small_count} rows with very small prices (< 0.01). "
-            "This might indicate data normalization issues."
+            "%s: Found %d rows with very small prices (< 0.01). "
+            "This might indicate data normalization issues.",
+            ticker,
+            small_count,
         )
 
 
@@ -146,12 +192,13 @@ def _standardize_ohlcv(df: pd.DataFrame, ticker: str = "") -> pd.DataFrame:
     # Handle volume - indices may not have volume
     if "volume" not in df.columns:
         if is_index:
-            logger.info(f"{ticker}: No volume data available (index ticker). Using zero volume.")
+            logger.info("%s: No volume data available (index ticker). Using zero volume.", ticker)
             df["volume"] = 0.0
         else:
             logger.warning(
-                f"{ticker}: No volume column found. This is unusual for stocks. "
-                "Using zero volume as fallback."
+                "%s: No volume column found. This is unusual for stocks. "
+                "Using zero volume as fallback.",
+                ticker,
             )
             df["volume"] = 0.0
 
@@ -170,17 +217,61 @@ def _standardize_ohlcv(df: pd.DataFrame, ticker: str = "") -> pd.DataFrame:
     return df
 
 
+def _cache_mtime_ns(path: Path) -> Optional[int]:
+    """mtime of a cache file, or None if it does not exist (one stat() instead of exists() + stat())."""
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+# Layout written by `save_cached_csv`; typed up front so the C parser skips dtype inference for prices
+_CACHE_COLUMNS = ["date", "open", "high", "low", "close", "volume"]
+_CACHE_PRICE_DTYPES = {"open": "float64", "high": "float64", "low": "float64", "close": "float64"}
+
+
 def load_cached_csv(path: Path) -> OHLCV:
-    df = pd.read_csv(path, parse_dates=["date"])
-    df = df.set_index("date").sort_index()
+    df = pd.read_csv(
+        path,
+        usecols=_CACHE_COLUMNS,
+        dtype=_CACHE_PRICE_DTYPES,
+        parse_dates=["date"],
+        index_col="date",
+        engine="c",
+    )
+    df = df.sort_index()
     return OHLCV(df=df)
 
 
 def save_cached_csv(ohlcv: OHLCV, path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    out = ohlcv.df.copy()
-    out.insert(0, "date", out.index)
-    out.to_csv(path, index=False)
+    # Index becomes the leading "date" column (same layout load_cached_csv expects)
+    ohlcv.df.to_csv(path, index_label="date")
+
+
+def load_cached_parquet(path: Path) -> OHLCV:
+    df = pd.read_parquet(path, columns=_CACHE_COLUMNS[1:])
+    df.index.name = "date"
+    return OHLCV(df=df.sort_index())
+
+
+def save_cached_parquet(ohlcv: OHLCV, path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    ohlcv.df.rename_axis("date").to_parquet(path)
+
+
+def _load_cache(path: Path) -> OHLCV:
+    """Read a cache file; the format follows the suffix (.parquet needs pyarrow, anything else is CSV)."""
+    if path.suffix == ".parquet":
+        return load_cached_parquet(path)
+    return load_cached_csv(path)
+
+
+def _save_cache(ohlcv: OHLCV, path: Path) -> None:
+    if path.suffix == ".parquet":
+        save_cached_parquet(ohlcv, path)
+    else:
+        save_cached_csv(ohlcv, path)
 
 
 def download_yahoo_ohlcv(
@@ -205,7 +296,8 @@ def download_yahoo_ohlcv(
         start: Start date in YYYY-MM-DD format
         end: End date in YYYY-MM-DD format
         interval: Data interval (default: "1d" for daily)
-        cache_path: Optional path to cache CSV file
+        cache_path: Optional cache file path; `.parquet` stores Parquet (requires pyarrow),
+            any other suffix stores CSV
         refresh: If True, re-download even if cache exists
         retries: Number of retry attempts (default: 3)
         retry_sleep_s: Base sleep time between retries in seconds (default: 1.0)
@@ -224,23 +316,31 @@ def download_yahoo_ohlcv(
     if not ticker:
         raise ValueError("Ticker cannot be empty")
 
-    # Check cache first
-    if cache_path and cache_path.exists() and not refresh:
+    memo_key = (ticker, interval, str(cache_path))
+
+    # Check cache first (already-parsed copy in memory, then the file on disk)
+    mtime_ns = _cache_mtime_ns(cache_path) if cache_path and not refresh else None
+    if mtime_ns is not None:
+        cached = _memo_get(memo_key, mtime_ns)
+        if cached is not None:
+            logger.info("Using in-memory cached data for %s (%s)", ticker, cache_path)
+            return cached
         try:
-            cached = load_cached_csv(cache_path)
+            cached = _load_cache(cache_path)
             if validate:
                 _validate_ohlcv_data(cached.df, ticker)
-            logger.info(f"Loaded cached data for {ticker} from {cache_path}")
+            logger.info("Loaded cached data for %s from %s", ticker, cache_path)
+            _memo_put(memo_key, mtime_ns, cached)
             return cached
         except Exception as e:
-            logger.warning(f"Failed to load cache for {ticker}: {e}. Re-downloading...")
+            logger.warning("Failed to load cache for %s: %s. Re-downloading...", ticker, e)
 
     import yfinance as yf
 
     last_err: Exception | None = None
     for attempt in range(1, retries + 1):
         try:
-            logger.info(f"Downloading {ticker} (attempt {attempt}/{retries})...")
+            logger.info("Downloading %s (attempt %d/%d)...", ticker, attempt, retries)
             
             df = yf.download(
                 tickers=ticker,
@@ -254,7 +354,7 @@ def download_yahoo_ohlcv(
             )
             
             if df is not None and not df.empty:
-                logger.info(f"Successfully downloaded {len(df)} rows for {ticker}")
+                logger.info("Successfully downloaded %d rows for %s", len(df), ticker)
                 break
                 
             last_err = ValueError(
@@ -265,9 +365,7 @@ def download_yahoo_ohlcv(
         except Exception as e:  # noqa: BLE001
             last_err = e
             error_msg = str(e)
-            logger.warning(
-                f"Attempt {attempt}/{retries} failed for {ticker}: {error_msg}"
-            )
+            logger.warning("Attempt %d/%d failed for %s: %s", attempt, retries, ticker, error_msg)
             
             # Provide helpful error messages for common issues
             if "certificate" in error_msg.lower() or "ssl" in error_msg.lower():
@@ -281,7 +379,7 @@ def download_yahoo_ohlcv(
         # Exponential backoff: sleep longer on each retry
         if attempt < retries:
             sleep_time = retry_sleep_s * (2 ** (attempt - 1))
-            logger.info(f"Waiting {sleep_time:.1f}s before retry...")
+            logger.info("Waiting %.1fs before retry...", sleep_time)
             time.sleep(sleep_time)
     else:
         # All retries exhausted
@@ -317,10 +415,11 @@ def download_yahoo_ohlcv(
         # Save to cache
         if cache_path:
             try:
-                save_cached_csv(ohlcv, cache_path)
-                logger.info(f"Cached data for {ticker} to {cache_path}")
+                _save_cache(ohlcv, cache_path)
+                logger.info("Cached data for %s to %s", ticker, cache_path)
+                _memo_put(memo_key, cache_path.stat().st_mtime_ns, ohlcv)
             except Exception as e:
-                logger.warning(f"Failed to cache data for {ticker}: {e}")
+                logger.warning("Failed to cache data for %s: %s", ticker, e)
         
         return ohlcv
         
@@ -330,3 +429,117 @@ def download_yahoo_ohlcv(
             "This might indicate corrupted data or an unsupported ticker format."
         ) from e
 
+
+def download_yahoo_ohlcv_multi(
+    tickers: list[str],
+    start: str,
+    end: str,
+    interval: str = "1d",
+    cache_paths: Optional[dict[str, Path]] = None,
+    refresh: bool = False,
+    retries: int = 3,
+    retry_sleep_s: float = 1.0,
+    validate: bool = True,
+) -> dict[str, OHLCV]:
+    """
+    Download OHLCV data for several tickers with a single Yahoo Finance request.
+
+    Tickers with a usable cache file (see `download_yahoo_ohlcv`) are served from cache;
+    the rest are fetched together in one `yf.download` call and split per ticker.
+
+    Args:
+        tickers: Yahoo Finance ticker symbols
+        start: Start date in YYYY-MM-DD format
+        end: End date in YYYY-MM-DD format
+        interval: Data interval (default: "1d" for daily)
+        cache_paths: Optional mapping ticker -> cache CSV path
+        refresh: If True, re-download even if cache exists
+        retries: Number of retry attempts for the batched request (default: 3)
+        retry_sleep_s: Base sleep time between retries in seconds (exponential backoff)
+        validate: If True, validate data quality (gaps, outliers, etc.)
+
+    Returns:
+        Mapping ticker -> OHLCV. Tickers that could not be downloaded or failed
+        validation are left out; call `download_yahoo_ohlcv` for those to get the
+        per-ticker error.
+    """
+    cache_paths = cache_paths or {}
+    tickers = list(dict.fromkeys(tickers))
+
+    out: dict[str, OHLCV] = {}
+    pending: list[str] = []
+    for t in tickers:
+        cache_path = cache_paths.get(t)
+        memo_key = (t, interval, str(cache_path))
+        mtime_ns = _cache_mtime_ns(cache_path) if cache_path and not refresh else None
+        if mtime_ns is not None:
+            cached = _memo_get(memo_key, mtime_ns)
+            if cached is None:
+                try:
+                    cached = _load_cache(cache_path)
+                    if validate:
+                        _validate_ohlcv_data(cached.df, t)
+                    _memo_put(memo_key, mtime_ns, cached)
+                except Exception as e:
+                    logger.warning("Failed to load cache for %s: %s. Re-downloading...", t, e)
+                    cached = None
+            if cached is not None:
+                out[t] = cached
+                continue
+        pending.append(t)
+
+    if not pending:
+        return out
+
+    import yfinance as yf
+
+    raw = None
+    for attempt in range(1, retries + 1):
+        try:
+            logger.info("Downloading %d tickers in one request (attempt %d/%d)...", len(pending), attempt, retries)
+            raw = yf.download(
+                tickers=pending,
+                start=start,
+                end=end,
+                interval=interval,
+                auto_adjust=False,
+                progress=False,
+                threads=False,
+                group_by="ticker",
+            )
+            if raw is not None and not raw.empty:
+                break
+        except Exception as e:  # noqa: BLE001
+            logger.warning("Attempt %d/%d failed for batched download: %s", attempt, retries, e)
+        raw = None
+        if attempt < retries:
+            time.sleep(retry_sleep_s * (2 ** (attempt - 1)))
+
+    if raw is None:
+        logger.warning("Batched download returned no data for: %s", pending)
+        return out
+
+    available = set(raw.columns.get_level_values(0)) if isinstance(raw.columns, pd.MultiIndex) else set()
+    for t in pending:
+        if t not in available:
+            logger.warning("%s: missing from batched download response", t)
+            continue
+        try:
+            df = _standardize_ohlcv(raw[t], ticker=t)
+            if validate:
+                _validate_ohlcv_data(df, t)
+        except Exception as e:  # noqa: BLE001
+            logger.warning("%s: batched download unusable: %s", t, e)
+            continue
+
+        ohlcv = OHLCV(df=df)
+        cache_path = cache_paths.get(t)
+        if cache_path:
+            try:
+                _save_cache(ohlcv, cache_path)
+                _memo_put((t, interval, str(cache_path)), cache_path.stat().st_mtime_ns, ohlcv)
+            except Exception as e:
+                logger.warning("Failed to cache data for %s: %s", t, e)
+        out[t] = ohlcv
+
+    return out
@@ -3,6 +3,28 @@ from __future__ import annotations
 import numpy as np
 import pandas as pd
 
+try:  # optional: compiled fast path for `make_features`
+    from src.research._features_numba import build_features as _build_features_numba
+except ImportError:  # numba not installed -> pandas path only
+    _build_features_numba = None
+
+
+# Columns appended by `make_features`, in order
+FEATURE_COLS = (
+    "ret_1",
+    "ret_5",
+    "vol_10",
+    "sma_10",
+    "sma_50",
+    "ema_20",
+    "rsi_14",
+    "macd",
+    "macd_signal",
+    "macd_hist",
+    "vol_chg_1",
+    "vol_sma_20",
+)
+
 
 def compute_rsi(close: pd.Series, window: int = 14) -> pd.Series:
     delta = close.diff()
@@ -22,31 +44,61 @@ def compute_macd(close: pd.Series, short_window: int = 12, long_window: int = 26
     return pd.DataFrame({"macd": macd, "macd_signal": signal, "macd_hist": hist})
 
 
+def _numba_inputs(df: pd.DataFrame) -> tuple[np.ndarray, np.ndarray] | None:
+    """Return (close, volume) float64 arrays if the Numba kernel can reproduce the pandas path."""
+    if _build_features_numba is None:
+        return None
+    close = df["close"]
+    volume = df["volume"]
+    if close.dtype != np.float64 or not (volume.dtype == np.float64 or pd.api.types.is_integer_dtype(volume.dtype)):
+        return None
+    c = close.to_numpy()
+    v = volume.to_numpy(dtype=np.float64)
+    # NaN/inf/zero prices hit pandas-specific semantics; leave those to pandas
+    if not (np.isfinite(c).all() and (c > 0).all() and np.isfinite(v).all()):
+        return None
+    return c, v
+
+
 def make_features(df: pd.DataFrame) -> pd.DataFrame:
     """
     Input: OHLCV dataframe with columns: open/high/low/close/volume.
     Output: dataframe with added feature columns (no label).
-    """
-    out = df.copy()
-
-    out["ret_1"] = out["close"].pct_change(1)
-    out["ret_5"] = out["close"].pct_change(5)
-    out["vol_10"] = out["ret_1"].rolling(10).std()
-
-    out["sma_10"] = out["close"].rolling(10).mean()
-    out["sma_50"] = out["close"].rolling(50).mean()
-    out["ema_20"] = out["close"].ewm(span=20, adjust=False).mean()
 
-    out["rsi_14"] = compute_rsi(out["close"], window=14)
-
-    macd = compute_macd(out["close"])
-    out = out.join(macd)
-
-    # volume features
-    out["vol_chg_1"] = out["volume"].pct_change(1)
-    out["vol_sma_20"] = out["volume"].rolling(20).mean()
-
-    return out
+    Uses the Numba kernel when numba is installed and the data is clean,
+    otherwise the pandas implementation.
+    """
+    inputs = _numba_inputs(df)
+    if inputs is None:
+        return _make_features_pandas(df)
+
+    feats = _build_features_numba(*inputs)
+    return df.assign(**{col: feats[:, i] for i, col in enumerate(FEATURE_COLS)})
+
+
+def _make_features_pandas(df: pd.DataFrame) -> pd.DataFrame:
+    # Columns are computed from the input's series and attached in one assign()
+    # (no defensive copy of df, no per-column inserts)
+    close = df["close"]
+    volume = df["volume"]
+    ret_1 = close.pct_change(1)
+    macd = compute_macd(close)
+
+    return df.assign(
+        ret_1=ret_1,
+        ret_5=close.pct_change(5),
+        vol_10=ret_1.rolling(10).std(),
+        sma_10=close.rolling(10).mean(),
+        sma_50=close.rolling(50).mean(),
+        ema_20=close.ewm(span=20, adjust=False).mean(),
+        rsi_14=compute_rsi(close, window=14),
+        macd=macd["macd"],
+        macd_signal=macd["macd_signal"],
+        macd_hist=macd["macd_hist"],
+        # volume features
+        vol_chg_1=volume.pct_change(1),
+        vol_sma_20=volume.rolling(20).mean(),
+    )
 
 
 def add_label_forward_return_up(df_with_features: pd.DataFrame, days: int = 1, threshold: float = 0.0) -> pd.DataFrame:
@@ -55,10 +107,8 @@ def add_label_forward_return_up(df_with_features: pd.DataFrame, days: int = 1, t
     """
     if days < 1:
         raise ValueError("days must be >= 1")
-    out = df_with_features.copy()
-    out[f"fwd_ret_{days}"] = out["close"].pct_change(days).shift(-days)
-    out["label_up"] = (out[f"fwd_ret_{days}"] > threshold).astype(int)
-    return out
+    fwd_ret = df_with_features["close"].pct_change(days).shift(-days)
+    return df_with_features.assign(**{f"fwd_ret_{days}": fwd_ret, "label_up": (fwd_ret > threshold).astype(int)})
 
 
 def add_label_next_day_up(df_with_features: pd.DataFrame, threshold: float = 0.0) -> pd.DataFrame:
@@ -71,6 +121,6 @@ def clean_ml_frame(df: pd.DataFrame, feature_cols: list[str], label_col: str) ->
     missing = [c for c in cols if c not in df.columns]
     if missing:
         raise ValueError(f"Missing columns in ML frame: {missing}")
-    out = df[cols].replace([np.inf, -np.inf], np.nan).dropna().copy()
+    out = df[cols].replace([np.inf, -np.inf], np.nan).dropna()
     return out
 
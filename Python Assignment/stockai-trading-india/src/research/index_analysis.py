@@ -15,6 +15,19 @@ class IndexComparison:
     sector_breakdown: dict[str, list[str]] | None = None
 
 
+def _rolling_compound_return(returns: pd.Series, window: int) -> pd.Series:
+    """
+    Compounded return over each rolling window: prod(1 + r) - 1.
+
+    Computed as expm1 of a rolling sum of log1p(r) (one vectorized pass instead of a
+    Python call per window). A -100% return has no finite log, so such series use
+    the direct product.
+    """
+    if (returns <= -1.0).any():
+        return (1 + returns).rolling(window=window).apply(lambda x: x.prod() - 1.0, raw=True)
+    return np.expm1(np.log1p(returns).rolling(window=window).sum())
+
+
 def calculate_relative_strength(
     stock_returns: pd.Series,
     index_returns: pd.Series,
@@ -37,8 +50,8 @@ def calculate_relative_strength(
     index_aligned = index_returns.reindex(common_dates)
     
     # Calculate cumulative returns over rolling window
-    stock_cumret = (1 + stock_aligned).rolling(window=window).apply(lambda x: x.prod() - 1.0, raw=False)
-    index_cumret = (1 + index_aligned).rolling(window=window).apply(lambda x: x.prod() - 1.0, raw=False)
+    stock_cumret = _rolling_compound_return(stock_aligned, window)
+    index_cumret = _rolling_compound_return(index_aligned, window)
     
     # Relative strength = stock return - index return
     relative_strength = stock_cumret - index_cumret
@@ -34,12 +34,12 @@ def train_baseline_classifier(
 
     n = len(df)
     split = int(n * (1.0 - test_size))
-    train_df = df.iloc[:split].copy()
-    test_df = df.iloc[split:].copy()
 
-    X_train = train_df[feature_cols].values
-    y_train = train_df[label_col].values
-    X_test = test_df[feature_cols].values
+    # Slice NumPy views instead of copying train/test DataFrames
+    X = df[feature_cols].to_numpy()
+    y = df[label_col].to_numpy()
+    X_train, X_test = X[:split], X[split:]
+    y_train, y_test = y[:split], y[split:]
 
     model = Pipeline(
         steps=[
@@ -49,8 +49,8 @@ def train_baseline_classifier(
     )
     model.fit(X_train, y_train)
 
-    prob_up = model.predict_proba(X_test)[:, 1]
-    pred = pd.DataFrame(index=test_df.index, data={"prob_up": prob_up, "y_true": test_df[label_col].values})
+    prob_up = predict_proba(model, X_test)
+    pred = pd.DataFrame(index=df.index[split:], data={"prob_up": prob_up, "y_true": y_test})
 
     return TrainResult(model=model, feature_cols=feature_cols), pred
 
@@ -62,12 +62,15 @@ def walk_forward_predict_proba(
     min_train_size: int = 252,
     retrain_every: int = 20,
     random_state: int = 42,
+    warm_start: bool = False,
 ) -> pd.Series:
     """
     Expanding-window walk-forward probability predictions.
 
     - Train on [0:i) and predict on [i:i+retrain_every)
     - Starts after `min_train_size` rows
+    - warm_start=True seeds each refit with the previous coefficients (fewer solver
+      iterations; probabilities match a cold fit only up to the solver tolerance)
     Returns a Series (index aligned) with probabilities; early rows are NaN.
     """
     from sklearn.linear_model import LogisticRegression
@@ -80,43 +83,88 @@ def walk_forward_predict_proba(
         raise ValueError("retrain_every must be >= 1.")
 
     n = len(df)
-    prob = pd.Series(index=df.index, dtype="float64", name="prob_up")
+    # Loop-invariant: pull the feature matrix/labels out once and slice row ranges per step
+    X = df[feature_cols].to_numpy()
+    y = df[label_col].to_numpy()
+    prob = np.full(n, np.nan)
 
     model = Pipeline(
         steps=[
             ("scaler", StandardScaler()),
-            ("clf", LogisticRegression(max_iter=2000, random_state=random_state)),
+            ("clf", LogisticRegression(max_iter=2000, random_state=random_state, warm_start=warm_start)),
         ]
     )
 
     i = min_train_size
     while i < n:
-        train_df = df.iloc[:i]
-        test_df = df.iloc[i : min(i + retrain_every, n)]
+        stop = min(i + retrain_every, n)
+        model.fit(X[:i], y[:i])
+        prob[i:stop] = predict_proba(model, X[i:stop])
+        i = stop
+
+    return pd.Series(prob, index=df.index, name="prob_up")
 
-        X_train = train_df[feature_cols].values
-        y_train = train_df[label_col].values
-        X_test = test_df[feature_cols].values
 
-        model.fit(X_train, y_train)
-        prob.iloc[i : i + len(test_df)] = model.predict_proba(X_test)[:, 1]
-        i += len(test_df)
+def _fast_logistic_proba(model: object, X: np.ndarray) -> np.ndarray | None:
+    """
+    Closed-form P(label=1) for the baseline StandardScaler -> binary LogisticRegression pipeline.
+
+    Same arithmetic as sklearn (scale, linear decision, expit) without the per-call input
+    validation. Returns None (sklearn fallback) for any other model, for a scaler fitted
+    on named columns, or for input that is not a finite 2-D array of the fitted width.
+    """
+    from scipy.special import expit
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.preprocessing import StandardScaler
 
-    return prob
+    steps = getattr(model, "steps", None)
+    if steps is None or len(steps) != 2:
+        return None
+    scaler, clf = steps[0][1], steps[1][1]
+    if not (isinstance(scaler, StandardScaler) and isinstance(clf, LogisticRegression)):
+        return None
+    if not hasattr(clf, "coef_") or len(clf.classes_) != 2:
+        return None
+    if hasattr(scaler, "feature_names_in_"):
+        return None  # sklearn checks column names/order
+
+    Z = np.asarray(X, dtype=np.float64)
+    if Z.ndim != 2 or Z.shape[1] != clf.coef_.shape[1] or not np.isfinite(Z).all():
+        return None  # let sklearn raise its usual error
+    if scaler.with_mean:
+        Z = Z - scaler.mean_
+    if scaler.with_std:
+        Z = Z / scaler.scale_
+    return expit(Z @ clf.coef_[0] + clf.intercept_[0])
 
 
 def predict_proba(model: object, X: np.ndarray) -> np.ndarray:
+    fast = _fast_logistic_proba(model, X)
+    if fast is not None:
+        return fast
     return model.predict_proba(X)[:, 1]
 
 
-def save_model(model: object, path: str) -> None:
+def save_model(model: object, path: str, compress: int = 0) -> None:
+    """
+    Persist a fitted model with joblib.
+
+    compress (0-9) trades load speed for file size; compressed files cannot be
+    memory-mapped by `load_model(..., mmap_mode=...)`.
+    """
     import joblib
 
-    joblib.dump(model, path)
+    joblib.dump(model, path, compress=compress)
 
 
-def load_model(path: str) -> object:
+def load_model(path: str, mmap_mode: str | None = None) -> object:
+    """
+    Load a model saved by `save_model`.
+
+    mmap_mode="r" maps large NumPy arrays read-only instead of copying them, so
+    several processes loading the same (uncompressed) file share its pages.
+    """
     import joblib
 
-    return joblib.load(path)
+    return joblib.load(path, mmap_mode=mmap_mode)
 
@@ -7,7 +7,7 @@ from typing import Optional
 import numpy as np
 import pandas as pd
 
-from src.research.backtest import BacktestResult, backtest_long_cash_from_prob
+from src.research.backtest import BacktestResult, _cagr, _max_drawdown, _sharpe, backtest_long_cash_from_prob
 
 
 class PositionSizing(Enum):
@@ -90,52 +90,31 @@ def backtest_portfolio(
     for ticker, bt_result in individual_results.items():
         equity_curves[ticker] = bt_result.equity_curve.reindex(all_dates).ffill().fillna(1.0)
     
-    # Calculate position weights
-    position_weights_df = pd.DataFrame(index=all_dates, columns=list(ticker_data.keys()))
-    
-    for date in all_dates:
-        # Determine which assets to hold based on probabilities
-        weights = {}
-        active_tickers = []
-        
-        for ticker in ticker_data.keys():
-            prob_series = ticker_probabilities[ticker]
-            if date in prob_series.index and not pd.isna(prob_series.loc[date]):
-                prob = prob_series.loc[date]
-                if prob >= prob_threshold:
-                    active_tickers.append(ticker)
-        
-        # Calculate weights based on sizing method
-        if position_sizing == PositionSizing.EQUAL_WEIGHT:
-            if active_tickers:
-                weight_per_ticker = 1.0 / len(active_tickers)
-                for ticker in active_tickers:
-                    weights[ticker] = weight_per_ticker
-        elif position_sizing == PositionSizing.CUSTOM:
-            if custom_weights is None:
-                raise ValueError("custom_weights must be provided when position_sizing=CUSTOM")
-            total_custom_weight = sum(custom_weights.get(t, 0.0) for t in active_tickers)
-            if total_custom_weight > 0:
-                for ticker in active_tickers:
-                    weights[ticker] = custom_weights.get(ticker, 0.0) / total_custom_weight
-        else:
-            raise ValueError(f"Unsupported position_sizing: {position_sizing}")
-        
-        # Store weights
-        for ticker in ticker_data.keys():
-            position_weights_df.loc[date, ticker] = weights.get(ticker, 0.0)
-    
-    position_weights_df = position_weights_df.fillna(0.0).astype(float)
+    # Calculate position weights: Date x Ticker matrix of probabilities -> active mask -> weights
+    tickers = list(ticker_data.keys())
+    prob_matrix = np.column_stack(
+        [ticker_probabilities[t].reindex(all_dates).to_numpy(dtype=float) for t in tickers]
+    )
+    active = prob_matrix >= prob_threshold  # NaN (no prediction yet) -> inactive
+    
+    # Calculate weights based on sizing method
+    if position_sizing == PositionSizing.EQUAL_WEIGHT:
+        raw_weights = active.astype(float)
+    elif position_sizing == PositionSizing.CUSTOM:
+        if custom_weights is None:
+            raise ValueError("custom_weights must be provided when position_sizing=CUSTOM")
+        raw_weights = np.where(active, np.array([custom_weights.get(t, 0.0) for t in tickers], dtype=float), 0.0)
+    else:
+        raise ValueError(f"Unsupported position_sizing: {position_sizing}")
+    
+    total_weight = raw_weights.sum(axis=1, keepdims=True)
+    weights = np.divide(raw_weights, total_weight, out=np.zeros_like(raw_weights), where=total_weight > 0)
+    position_weights_df = pd.DataFrame(weights, index=pd.DatetimeIndex(all_dates), columns=tickers)
     
     # Calculate portfolio equity curve (weighted sum of individual equity curves)
-    portfolio_equity = pd.Series(index=all_dates, dtype=float)
-    for date in all_dates:
-        equity_sum = 0.0
-        for ticker in ticker_data.keys():
-            weight = position_weights_df.loc[date, ticker]
-            if weight > 0 and ticker in equity_curves:
-                equity_sum += weight * equity_curves[ticker].loc[date]
-        portfolio_equity.loc[date] = equity_sum if equity_sum > 0 else 1.0
+    equity_matrix = pd.DataFrame(equity_curves, index=all_dates)[position_weights_df.columns].to_numpy()
+    equity_sum = (position_weights_df.to_numpy() * equity_matrix).sum(axis=1)
+    portfolio_equity = pd.Series(np.where(equity_sum > 0, equity_sum, 1.0), index=all_dates, dtype=float)
     
     # Normalize to start at 1.0
     if not portfolio_equity.empty:
@@ -145,20 +124,12 @@ def backtest_portfolio(
     portfolio_returns = portfolio_equity.pct_change(1).fillna(0.0)
     
     # Benchmark: equal-weighted buy-and-hold of all assets
-    benchmark_equity = pd.Series(index=all_dates, dtype=float)
-    for date in all_dates:
-        bench_sum = 0.0
-        for ticker in ticker_data.keys():
-            if ticker in equity_curves:
-                bench_sum += equity_curves[ticker].loc[date]
-        benchmark_equity.loc[date] = bench_sum / len(ticker_data) if ticker_data else 1.0
+    benchmark_equity = pd.Series(equity_matrix.sum(axis=1) / len(tickers), index=all_dates, dtype=float)
     
     if not benchmark_equity.empty:
         benchmark_equity = benchmark_equity / benchmark_equity.iloc[0]
     
     # Calculate portfolio-level stats
-    from src.research.backtest import _max_drawdown, _sharpe, _cagr
-    
     stats = {
         "days": int(portfolio_returns.dropna().shape[0]),
         "total_return": float(portfolio_equity.iloc[-1] - 1.0) if not portfolio_equity.empty else 0.0,
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
+from string import Template
 
 import matplotlib.pyplot as plt
 import pandas as pd
@@ -10,6 +11,45 @@ import seaborn as sns
 sns.set_style("whitegrid")
 plt.rcParams["figure.figsize"] = (12, 6)
 
+# HTML report layout, built once at import; generate_html_report only fills in the blanks
+_REPORT_HTML = Template("""
+<!DOCTYPE html>
+<html>
+<head>
+    <title>$title</title>
+    <style>
+        body { font-family: Arial, sans-serif; margin: 20px; }
+        h1 { color: #333; }
+        h2 { color: #666; margin-top: 30px; }
+        img { max-width: 100%; height: auto; margin: 20px 0; }
+        table { border-collapse: collapse; width: 100%; margin: 20px 0; }
+        th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
+        th { background-color: #f2f2f2; }
+    </style>
+</head>
+<body>
+    <h1>$title</h1>
+    
+    <h2>Performance Statistics</h2>
+    <table>
+$stats_rows
+    </table>
+    
+    <h2>Equity Curve</h2>
+    <img src="equity_curve.png" alt="Equity Curve">
+    
+    <h2>Drawdown</h2>
+    <img src="drawdown.png" alt="Drawdown">
+$returns_section
+</body>
+</html>
+""")
+_STATS_ROW = "        <tr><th>{name}</th><td>{value}</td></tr>\n"
+_RETURNS_SECTION = """
+    <h2>Returns Distribution</h2>
+    <img src="returns_distribution.png" alt="Returns Distribution">
+"""
+
 
 def plot_equity_curve(
     equity: pd.Series,
@@ -250,55 +290,18 @@ def generate_html_report(
         plot_paths["returns"] = returns_path.name
     
     # Generate HTML
-    html_content = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <title>{title}</title>
-    <style>
-        body {{ font-family: Arial, sans-serif; margin: 20px; }}
-        h1 {{ color: #333; }}
-        h2 {{ color: #666; margin-top: 30px; }}
-        img {{ max-width: 100%; height: auto; margin: 20px 0; }}
-        table {{ border-collapse: collapse; width: 100%; margin: 20px 0; }}
-        th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
-        th {{ background-color: #f2f2f2; }}
-    </style>
-</head>
-<body>
-    <h1>{title}</h1>
-    
-    <h2>Performance Statistics</h2>
-    <table>
-"""
-    
-    if stats:
-        for key, value in stats.items():
-            if isinstance(value, float):
-                html_content += f"        <tr><th>{key.replace('_', ' ').title()}</th><td>{value:.4f}</td></tr>\n"
-            else:
-                html_content += f"        <tr><th>{key.replace('_', ' ').title()}</th><td>{value}</td></tr>\n"
-    
-    html_content += """
-    </table>
-    
-    <h2>Equity Curve</h2>
-    <img src="equity_curve.png" alt="Equity Curve">
-    
-    <h2>Drawdown</h2>
-    <img src="drawdown.png" alt="Drawdown">
-"""
-    
-    if returns is not None:
-        html_content += """
-    <h2>Returns Distribution</h2>
-    <img src="returns_distribution.png" alt="Returns Distribution">
-"""
-    
-    html_content += """
-</body>
-</html>
-"""
+    stats_rows = "".join(
+        _STATS_ROW.format(
+            name=key.replace("_", " ").title(),
+            value=f"{value:.4f}" if isinstance(value, float) else value,
+        )
+        for key, value in (stats or {}).items()
+    )
+    html_content = _REPORT_HTML.substitute(
+        title=title,
+        stats_rows=stats_rows,
+        returns_section=_RETURNS_SECTION if returns is not None else "",
+    )
     
     output_path.write_text(html_content)
 
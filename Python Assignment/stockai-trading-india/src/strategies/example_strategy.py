@@ -3,9 +3,15 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Any, Dict, Optional
 
+import numpy as np
 import pandas as pd
 
 
+def _window_mean(values: np.ndarray, window: int) -> float:
+    """Mean of the last `window` values (NaN if any is missing), i.e. rolling(window).mean().iloc[-1]."""
+    return float(values[-window:].mean())
+
+
 @dataclass
 class ExampleStrategy:
     """
@@ -38,15 +44,14 @@ class ExampleStrategy:
         if "close" not in data.columns:
             return "hold"
 
-        close = data["close"].astype(float)
+        close = data["close"].to_numpy(dtype=float)
         if close.shape[0] < max(self.short_window, self.long_window) + 2:
             return "hold"
 
-        sma_s = close.rolling(self.short_window).mean()
-        sma_l = close.rolling(self.long_window).mean()
-
-        prev = sma_s.iloc[-2] - sma_l.iloc[-2]
-        curr = sma_s.iloc[-1] - sma_l.iloc[-1]
+        # Only the last two SMA values matter: average the trailing windows directly
+        # instead of computing full rolling series
+        prev = _window_mean(close[:-1], self.short_window) - _window_mean(close[:-1], self.long_window)
+        curr = _window_mean(close, self.short_window) - _window_mean(close, self.long_window)
 
         if pd.isna(prev) or pd.isna(curr):
             return "hold"
@@ -0,0 +1,96 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401
+except ImportError:
+    pyarrow = None
+
+from src.research.data import OHLCV, download_yahoo_ohlcv, download_yahoo_ohlcv_multi, save_cached_csv, save_cached_parquet
+
+
+def _ohlcv(n=30, start=100.0):
+    idx = pd.bdate_range("2023-01-02", periods=n)
+    close = [start + i for i in range(n)]
+    df = pd.DataFrame(
+        {"open": close, "high": [c + 1 for c in close], "low": [c - 1 for c in close], "close": close, "volume": 1000.0},
+        index=idx,
+    )
+    df.index.name = "date"
+    return OHLCV(df=df)
+
+
+class TestCachedDownload(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = Path(self.tmp.name) / "TEST.NS.csv"
+        save_cached_csv(_ohlcv(), self.cache)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _load(self):
+        return download_yahoo_ohlcv("TEST.NS", start="2023-01-01", end="2023-03-01", cache_path=self.cache)
+
+    def test_repeated_cache_hits_reuse_parsed_frame(self):
+        first = self._load()
+        self.assertEqual(len(first.df), 30)
+        self.assertIs(self._load(), first)
+
+    def test_rewritten_cache_file_is_reparsed(self):
+        first = self._load()
+        save_cached_csv(_ohlcv(start=200.0), self.cache)
+        st = self.cache.stat()
+        os.utime(self.cache, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        second = self._load()
+        self.assertIsNot(second, first)
+        self.assertEqual(second.df["close"].iloc[0], 200.0)
+
+    @unittest.skipIf(pyarrow is None, "pyarrow not installed")
+    def test_parquet_cache_round_trip(self):
+        path = Path(self.tmp.name) / "TEST.NS.parquet"
+        first = self._load()
+        save_cached_parquet(first, path)
+        loaded = download_yahoo_ohlcv("TEST.NS", start="2023-01-01", end="2023-03-01", cache_path=path)
+        pd.testing.assert_frame_equal(loaded.df, first.df, check_freq=False)
+
+
+class TestMultiDownload(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_fetches_uncached_tickers_in_one_request(self):
+        cached = self.dir / "A.NS.csv"
+        save_cached_csv(_ohlcv(), cached)
+        paths = {"A.NS": cached, "B.NS": self.dir / "B.NS.csv", "C.NS": self.dir / "C.NS.csv"}
+
+        raw = {}
+        for t, start in (("B.NS", 200.0), ("C.NS", 300.0)):
+            df = _ohlcv(start=start).df.rename(columns=str.title)
+            for col in df.columns:
+                raw[(t, col)] = df[col]
+        raw = pd.DataFrame(raw)
+
+        with mock.patch("yfinance.download", return_value=raw) as dl:
+            got = download_yahoo_ohlcv_multi(list(paths), "2023-01-01", "2023-03-01", cache_paths=paths)
+
+        dl.assert_called_once()
+        self.assertEqual(dl.call_args.kwargs["tickers"], ["B.NS", "C.NS"])
+        self.assertEqual(list(got), ["A.NS", "B.NS", "C.NS"])
+        self.assertEqual(got["C.NS"].df["close"].iloc[0], 300.0)
+        self.assertTrue(paths["B.NS"].exists())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from src.research import features
+from src.research.features import FEATURE_COLS, make_features
+
+
+def _ohlcv(n=300, seed=0):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    volume = rng.integers(1000, 100000, n).astype(float)
+    volume[::37] = 0.0
+    idx = pd.bdate_range("2022-01-03", periods=n)
+    return pd.DataFrame(
+        {"open": close, "high": close * 1.01, "low": close * 0.99, "close": close, "volume": volume},
+        index=idx,
+    )
+
+
+class TestMakeFeatures(unittest.TestCase):
+
+    def test_adds_feature_columns(self):
+        df = _ohlcv()
+        out = make_features(df)
+        self.assertEqual(list(out.columns), list(df.columns) + list(FEATURE_COLS))
+        self.assertEqual(list(df.columns), ["open", "high", "low", "close", "volume"])
+
+    @unittest.skipIf(features._build_features_numba is None, "numba not installed")
+    def test_numba_path_matches_pandas(self):
+        df = _ohlcv()
+        fast = make_features(df)
+        ref = features._make_features_pandas(df)
+        pd.testing.assert_frame_equal(fast, ref, rtol=1e-9, atol=1e-9)
+
+    def test_nan_close_uses_pandas_path(self):
+        df = _ohlcv()
+        df.iloc[120, df.columns.get_loc("close")] = np.nan
+        self.assertIsNone(features._numba_inputs(df))
+        pd.testing.assert_frame_equal(make_features(df), features._make_features_pandas(df))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import LogisticRegression
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import StandardScaler
+
+from src.research.ml import predict_proba
+
+
+def _fitted(X, y):
+    return Pipeline([("scaler", StandardScaler()), ("clf", LogisticRegression())]).fit(X, y)
+
+
+class TestPredictProba(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.X = rng.normal(size=(200, 12))
+        self.y = (self.X[:, 0] + rng.normal(0, 0.5, 200) > 0).astype(int)
+        self.model = _fitted(self.X, self.y)
+
+    def test_matches_sklearn(self):
+        np.testing.assert_allclose(predict_proba(self.model, self.X), self.model.predict_proba(self.X)[:, 1])
+
+    def test_wrong_width_raises(self):
+        with self.assertRaises(ValueError):
+            predict_proba(self.model, self.X[:, :1])
+
+    def test_one_dimensional_row_raises(self):
+        with self.assertRaises(ValueError):
+            predict_proba(self.model, self.X[0])
+
+    def test_dataframe_fit_checks_column_names(self):
+        cols = [f"f{i}" for i in range(12)]
+        model = _fitted(pd.DataFrame(self.X, columns=cols), self.y)
+        with self.assertRaises(ValueError):
+            predict_proba(model, pd.DataFrame(self.X, columns=cols[::-1]))
+
+
+if __name__ == '__main__':
+    unittest.main()
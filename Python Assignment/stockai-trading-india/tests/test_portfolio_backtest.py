@@ -0,0 +1,46 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from src.research.portfolio_backtest import PositionSizing, backtest_portfolio
+
+
+def _frame(n=10, start=100.0, step=1.0):
+    idx = pd.bdate_range("2023-01-02", periods=n)
+    return pd.DataFrame({"close": start + step * np.arange(n)}, index=idx)
+
+
+class TestPositionWeights(unittest.TestCase):
+
+    def setUp(self):
+        self.data = {"A": _frame(), "B": _frame(step=-0.5)}
+        idx = self.data["A"].index
+        self.probs = {
+            "A": pd.Series([np.nan, 0.6, 0.6, 0.4, 0.7, 0.7, 0.2, 0.6, 0.6, 0.6], index=idx),
+            "B": pd.Series([np.nan, 0.6, 0.3, 0.4, 0.8, np.nan, 0.2, 0.6, 0.9, 0.1], index=idx),
+        }
+
+    def test_equal_weight_splits_across_active_tickers(self):
+        res = backtest_portfolio(self.data, self.probs, prob_threshold=0.55)
+        w = res.position_weights
+        np.testing.assert_allclose(w["A"].to_numpy(), [0, 0.5, 1, 0, 0.5, 1, 0, 0.5, 0.5, 1])
+        np.testing.assert_allclose(w["B"].to_numpy(), [0, 0.5, 0, 0, 0.5, 0, 0, 0.5, 0.5, 0])
+
+    def test_custom_weights_are_renormalised_per_day(self):
+        res = backtest_portfolio(
+            self.data,
+            self.probs,
+            prob_threshold=0.55,
+            position_sizing=PositionSizing.CUSTOM,
+            custom_weights={"A": 3.0, "B": 1.0},
+        )
+        w = res.position_weights
+        self.assertAlmostEqual(w["A"].iloc[1], 0.75)
+        self.assertAlmostEqual(w["B"].iloc[1], 0.25)
+        self.assertAlmostEqual(w["A"].iloc[2], 1.0)
+        self.assertEqual(w.iloc[0].sum(), 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
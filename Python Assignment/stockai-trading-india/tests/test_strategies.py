@@ -1,4 +1,7 @@
 import unittest
+
+import pandas as pd
+
 from src.strategies.example_strategy import ExampleStrategy
 
 class TestExampleStrategy(unittest.TestCase):
@@ -20,5 +23,13 @@ class TestExampleStrategy(unittest.TestCase):
         self.assertEqual(self.strategy.get_parameters()['param1'], 10)
         self.assertEqual(self.strategy.get_parameters()['param2'], 5)
 
+    def test_crossovers(self):
+        strategy = ExampleStrategy(short_window=2, long_window=4)
+        falling = [10.0, 9.0, 8.0, 7.0, 6.0, 5.0]
+        self.assertEqual(strategy.execute(pd.DataFrame({"close": falling + [12.0]})), "buy")
+        rising = [5.0, 6.0, 7.0, 8.0, 9.0, 10.0]
+        self.assertEqual(strategy.execute(pd.DataFrame({"close": rising + [3.0]})), "sell")
+        self.assertEqual(strategy.execute(pd.DataFrame({"close": [5.0] * 8})), "hold")
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file